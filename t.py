@@ -1,13 +1,50 @@
+import asyncio
 import json
 import os
+import pickle
 import re
+import signal
 import subprocess
 import sys
-import threading
-import time
-import webbrowser
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Compiled once at import and shared by every output monitor. Lines are
+# pre-filtered with a plain substring check so the regex only runs on the
+# few lines that can actually announce the server URL.
+_URL_RE = re.compile(r'https?://\S+')
+
+# Universal newlines, as text-mode pipes used to give us.
+_NEWLINE_RE = re.compile(rb'\r\n|\r|\n')
+
+# The processed config is cached next to the input file (input.txt ->
+# input.txt.pkl) and reused while the input's mtime and size are unchanged.
+# It is safe to delete at any time. Bump the version whenever the processing
+# in _load_config changes so older caches are ignored.
+_CONFIG_CACHE_VERSION = 1
+
+# Files npm itself reads during install, matched by name at any depth.
+_NPM_INPUTS = ('package.json', 'package-lock.json', 'npm-shrinkwrap.json', '.npmrc')
+
+# Root lifecycle scripts npm runs during install; they may read any file.
+_INSTALL_SCRIPTS = ('preinstall', 'install', 'postinstall', 'prepublish', 'preprepare', 'prepare', 'postprepare')
+
+def _open_browser(url):
+    try:
+        if os.name == "nt":
+            os.startfile(url)
+        elif sys.platform == "darwin":
+            subprocess.Popen(["open", url])
+        else:
+            subprocess.Popen(["xdg-open", url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    except OSError:
+        print(f"Could not open a browser; visit {url} manually.")
+
 class ProjectSetup:
     def __init__(self, config_path):
         self.config = self._load_config(config_path)
@@ -26,8 +63,32 @@ class ProjectSetup:
         return Path(name if name else default_name)
 
     def _load_config(self, config_path):
-        with open(config_path) as f:
-            return json.load(f)
+        src = Path(config_path)
+        cache = src.with_suffix(src.suffix + '.pkl')
+        st = src.stat()
+        key = (_CONFIG_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+        try:
+            cached_key, config = pickle.loads(cache.read_bytes())
+            if cached_key == key:
+                return config
+        except Exception:
+            # Any unreadable, corrupt or foreign-shaped cache is just a miss.
+            pass
+
+        config = _json_loads(src.read_bytes())
+        files = config.get('files')
+        if isinstance(files, dict):
+            # Anything that is not text is left as-is so _merge_files fails on
+            # it inside setup_project, where the error gets logged.
+            for rel_path, content in files.items():
+                if isinstance(content, str):
+                    files[rel_path] = content.replace(';', ';\n').encode('utf-8')
+
+        try:
+            cache.write_bytes(pickle.dumps((key, config), pickle.HIGHEST_PROTOCOL))
+        except OSError:
+            pass
+        return config
 
     def _run_command(self, command, cwd=None):
         try:
@@ -36,9 +97,7 @@ class ProjectSetup:
                 cwd=cwd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                bufsize=65536
             )
             return process
         except Exception as e:
@@ -50,36 +109,103 @@ class ProjectSetup:
         with open(self.error_log, 'a') as f:
             f.write(f"ERROR: {message}\n")
 
+    def _iter_chunks(self, stream):
+        return iter(lambda: stream.read1(65536), b'')
+
+    def _split_lines(self, tail, data):
+        buf = tail + data
+        # A trailing \r may be the first half of a \r\n split across reads.
+        held = buf.endswith(b'\r')
+        if held:
+            buf = buf[:-1]
+        *lines, tail = _NEWLINE_RE.split(buf)
+        if held:
+            tail += b'\r'
+        return [line.decode('utf-8', 'replace') for line in lines], tail
+
+    def _iter_output(self, process):
+        tail = b''
+        for data in self._iter_chunks(process.stdout):
+            lines, tail = self._split_lines(tail, data)
+            if lines:
+                yield lines
+        if tail:
+            yield [tail.decode('utf-8', 'replace')]
+
+    def _open_url_in(self, output):
+        if 'Local:' not in output and 'Running on' not in output:
+            return False
+        match = _URL_RE.search(output)
+        if not match:
+            return False
+        url = match.group(0)
+        print(f"\nOpening application in browser: {url}")
+        _open_browser(url)
+        self.url_opened = True
+        return True
+
+    def _write_batch(self, lines):
+        write = sys.stdout.write
+        if self.url_opened:
+            # Once the URL has been opened there is nothing left to scan for.
+            for output in lines:
+                write(output.strip())
+                write('\n')
+        else:
+            for output in lines:
+                write(output.strip())
+                write('\n')
+                if not self.url_opened:
+                    self._open_url_in(output)
+        sys.stdout.flush()
+
+    def _pump_output(self, process):
+        for lines in self._iter_output(process):
+            self._write_batch(lines)
+
     def _monitor_output(self, process, success_message):
-        url_pattern = re.compile(r'(Local:\s+(https?://\S+)|(Running on\s+(https?://\S+))')
         print(success_message)
 
-        while True:
-            output = process.stdout.readline()
-            if output:
-                print(output.strip())
-                if not self.url_opened:
-                    match = url_pattern.search(output)
-                    if match:
-                        url = match.group(2) or match.group(4)
-                        print(f"\nOpening application in browser: {url}")
-                        webbrowser.open(url)
-                        self.url_opened = True
-            if process.poll() is not None:
-                break
+        self._pump_output(process)
+        process.wait()
 
     def setup_project(self):
         try:
             if not self._create_template():
                 return False
 
-            self._merge_files()
-            if not self._install_dependencies():
+            # npm's own inputs are written before the install starts and
+            # everything else is copied while it runs, unless the project has
+            # scripts or workspaces that make npm read other files too.
+            files = self.config['files']
+            npm_inputs = [rel_path for rel_path in files if os.path.basename(os.path.normpath(rel_path)) in _NPM_INPUTS]
+            rest = [rel_path for rel_path in files if rel_path not in npm_inputs]
+            print("\nCopying configuration files into project...")
+            self._merge_files(npm_inputs)
+            try:
+                with os.scandir(self.project_dir) as it:
+                    entries = {entry.name for entry in it}
+            except FileNotFoundError:
+                entries = set()
+            skip_install = not self.config.get('dependencies') or self._dependencies_installed(entries)
+            if not skip_install and self._install_reads_project():
+                self._merge_files(rest)
+                rest = []
+            install = None if skip_install else self._start_install()
+            try:
+                self._merge_files(rest)
+            except Exception:
+                if isinstance(install, subprocess.Popen):
+                    install.kill()
+                    install.wait()
+                raise
+
+            if not self._install_dependencies(install, skip_install):
                 return False
 
             print("\nProject setup completed successfully.")
             print(f"Project directory: {self.project_dir}")
-            return self._start_application()
+            return asyncio.run(self._start_application())
         except Exception as e:
             self._log_error(f"Critical error: {str(e)}")
             return False
@@ -96,34 +222,52 @@ class ProjectSetup:
             return process.returncode == 0
         return False
 
-    def _merge_files(self):
-        print("\nCopying configuration files into project...")
-        self.project_dir.mkdir(parents=True, exist_ok=True)
-        for rel_path, content in self.config['files'].items():
-            full_path = self.project_dir / rel_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(content.replace(';', ';\n'))
+    def _merge_files(self, rel_paths):
+        base = os.fspath(self.project_dir)
+        paths = {rel_path: os.path.join(base, rel_path) for rel_path in rel_paths}
+        os.makedirs(base, exist_ok=True)
+        for parent in {os.path.dirname(full_path) for full_path in paths.values()}:
+            os.makedirs(parent, exist_ok=True)
+
+        for rel_path, full_path in paths.items():
+            with open(full_path, 'wb') as f:
+                f.write(self.config['files'][rel_path])
             print(f"Updated: {rel_path}")
 
-    def _install_dependencies(self):
-        print("\nInstalling dependencies...")
-        if not self.config.get('dependencies'):
-            return True
+    def _dependencies_installed(self, entries):
+        return "node_modules" in entries
 
-        if (self.project_dir / "node_modules").exists():
-            print("Dependencies already installed.")
+    def _install_reads_project(self):
+        try:
+            manifest = _json_loads((self.project_dir / "package.json").read_bytes())
+        except FileNotFoundError:
+            return False
+        except ValueError:
             return True
+        if not isinstance(manifest, dict):
+            return True
+        scripts = manifest.get('scripts')
+        if not isinstance(scripts, dict):
+            scripts = {}
+        return bool(manifest.get('workspaces')) or any(name in scripts for name in _INSTALL_SCRIPTS)
 
+    def _start_install(self):
         cmd = ["npm", "install", "--legacy-peer-deps"] + self.config['dependencies']
-        process = self._run_command(cmd, cwd=self.project_dir)
+        return self._run_command(cmd, cwd=self.project_dir)
 
-        if process:
-            self._monitor_output(process, "Installing required packages...")
-            return process.returncode == 0
+    def _install_dependencies(self, install, skipped):
+        print("\nInstalling dependencies...")
+        if skipped:
+            if self.config.get('dependencies'):
+                print("Dependencies already installed.")
+            return True
+
+        if isinstance(install, subprocess.Popen):
+            self._monitor_output(install, "Installing required packages...")
+            return install.returncode == 0
         return False
 
-    def _start_application(self):
+    async def _start_application(self):
         print("\nLaunching development server...")
 
         if self.config['project_type'] == "React":
@@ -134,35 +278,61 @@ class ProjectSetup:
         else:
             return False
 
-        self.server_process = self._run_command(cmd, cwd=self.project_dir)
-        if not self.server_process:
+        try:
+            self.server_process = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=self.project_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                start_new_session=True
+            )
+        except Exception as e:
+            self._log_error(f"Command failed: {' '.join(cmd)}\nError: {str(e)}")
             return False
 
-        threading.Thread(target=self._monitor_server_output, daemon=True).start()
         print("\nPress Ctrl+C to stop the server.")
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        if os.name != "nt":
+            loop.add_signal_handler(signal.SIGINT, stop.set)
 
+        pump = asyncio.create_task(self._pump_server_output())
+        exited = asyncio.create_task(self.server_process.wait())
+        stopped = asyncio.create_task(stop.wait())
         try:
-            self.server_process.wait()
-        except KeyboardInterrupt:
-            self.server_process.terminate()
+            await asyncio.wait({exited, stopped}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            # Ctrl+C on Windows cancels the running task instead.
+            pass
+        finally:
+            if os.name != "nt":
+                loop.remove_signal_handler(signal.SIGINT)
+            stopped.cancel()
+
+        if self.server_process.returncode is None:
+            if os.name == "nt":
+                self.server_process.terminate()
+            else:
+                try:
+                    os.killpg(self.server_process.pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
             print("\nServer has been stopped.")
+        await asyncio.gather(pump, exited)
         return True
 
-    def _monitor_server_output(self):
-        url_pattern = re.compile(r'(Local:\s+(https?://\S+)|(Running on\s+(https?://\S+))')
+    async def _pump_server_output(self):
+        stdout = self.server_process.stdout
+        tail = b''
         while True:
-            output = self.server_process.stdout.readline()
-            if output:
-                print(output.strip())
-                if not self.url_opened:
-                    match = url_pattern.search(output)
-                    if match:
-                        url = match.group(2) or match.group(4)
-                        print(f"\nOpening application in browser: {url}")
-                        webbrowser.open(url)
-                        self.url_opened = True
-            if self.server_process.poll() is not None:
+            data = await stdout.read(65536)
+            if not data:
                 break
+            lines, tail = self._split_lines(tail, data)
+            if lines:
+                self._write_batch(lines)
+        if tail:
+            self._write_batch([tail.decode('utf-8', 'replace')])
 
 if __name__ == "__main__":
     if not Path("input.txt").exists():